@@ -245,7 +245,8 @@ class BedrockConverseAgent(Agent):
         else:
             if callable(conversation_history):
                 conversation_history = conversation_history()
-            ref = weakref.ref(conversation_history)
+            # The ref removes itself from the set once the conversation history is garbage collected:
+            ref = weakref.ref(conversation_history, self._instances_used.discard)
             if ref in self._instances_used:
                 raise RuntimeError(
                     f"Cannot use the same ConversationHistory instance {ref()} across multiple agent instances. "
@@ -254,7 +255,6 @@ class BedrockConverseAgent(Agent):
             else:
                 self._instances_used.add(ref)
             self._conversation_history = conversation_history
-            weakref.finalize(self, self._prune_instances_used)
         if not tracer:
             self._tracer = TeeTracer().add_tracer(InMemoryTracer())
         else:
@@ -264,7 +264,6 @@ class BedrockConverseAgent(Agent):
                 self._tracer = tracer
             else:
                 self._tracer = TeeTracer().add_tracer(tracer)
-            weakref.finalize(self, self._prune_instances_used)
         resource_attributes = self.tracer.context.resource_attributes
         if "service.name" not in resource_attributes:
             self.tracer.set_context(
@@ -351,18 +350,17 @@ class BedrockConverseAgent(Agent):
         - The spawned agent shares the same tracer as the parent agent
         - All tools registered with the parent agent are copied to the spawned instance
         - Conversation history is not shared; the spawned agent starts with a fresh history
-        - The spawned agent uses the same AWS session/Bedrock client configuration
+        - The spawned agent shares the Bedrock client of the parent agent (boto3 clients are threadsafe),
+          so spawning doesn't pay for creating a new client and its connection pool
         """
         spawned = type(self)(
-            **self._spawn_args, tools=list(self.tools.values()), tracer=self.tracer
+            **{**self._spawn_args, "bedrock_client": self.bedrock_client},
+            tools=list(self.tools.values()),
+            tracer=self.tracer,
         )
 
         return spawned
 
-    @classmethod
-    def _prune_instances_used(cls):
-        cls._instances_used = {r for r in cls._instances_used if r() is not None}
-
     @property
     def model_id(self):
         return self._model_id
@@ -577,14 +575,121 @@ class BedrockConverseAgent(Agent):
 
         return tool
 
-    @staticmethod
-    def _shorten_bedrock_model_id(model_id: str, prefix="", sep=":") -> str:
-        match = re.match(r"^([a-z]+\.)?([a-z]+)\.([a-z0-9-]+?)(-\d{8})?-v", model_id)
+    BEDROCK_MODEL_ID_REGEXP = re.compile(
+        r"^([a-z]+\.)?([a-z]+)\.([a-z0-9-]+?)(-\d{8})?-v"
+    )
+
+    @classmethod
+    def _shorten_bedrock_model_id(cls, model_id: str, prefix="", sep=":") -> str:
+        match = cls.BEDROCK_MODEL_ID_REGEXP.match(model_id)
         parts = [prefix] if prefix else []
         if match:
             parts.append(match.group(3))
         return sep.join(parts)
 
+    def _add_request_defaults(
+        self,
+        request: "ConverseRequestTypeDef | ConverseStreamRequestTypeDef",
+        tools: Sequence[Callable | Tool] | None,
+    ) -> dict[str, Tool]:
+        """
+        Add the agent's default configuration and the tool config to the request (in place),
+        and return the tools that are available to the LLM for this request.
+
+        Shared between converse() and converse_stream(), which send the same request shape.
+        """
+        if self.default_guardrail_config:
+            request["guardrailConfig"] = self.default_guardrail_config
+        if self.system_prompt:
+            request["system"] = [
+                {
+                    "text": self.system_prompt,
+                },
+            ]
+        if self.default_model_request_fields:
+            request["additionalModelRequestFields"] = self.default_model_request_fields
+        if self.default_model_response_field_paths:
+            request["additionalModelResponseFieldPaths"] = (
+                self.default_model_response_field_paths
+            )
+        if self.default_prompt_variables:
+            request["promptVariables"] = self.default_prompt_variables
+        if self.default_request_metadata:
+            request["requestMetadata"] = self.default_request_metadata
+        if self.default_performance_config:
+            request["performanceConfig"] = self.default_performance_config
+        if tools is not None:
+            tools_available = {
+                tool.tool_spec["name"]: tool
+                for tool in (
+                    BedrockConverseTool(tool) if callable(tool) else tool
+                    for tool in tools
+                )
+            }
+        else:
+            tools_available = self.tools
+        if tools_available:
+            request["toolConfig"] = {
+                "tools": [
+                    {"toolSpec": tool.tool_spec} for tool in tools_available.values()
+                ],
+            }
+        return tools_available
+
+    def _add_llm_request_trace_attributes(
+        self,
+        trace: Trace,
+        request: "ConverseRequestTypeDef | ConverseStreamRequestTypeDef",
+    ) -> None:
+        model_id = request["modelId"]
+        trace.add_attribute(
+            "peer.service",
+            self._shorten_bedrock_model_id(model_id, prefix="llm"),
+        )
+        trace.add_attribute("ai.trace.type", "llm-invocation")
+        trace.add_attribute(
+            "ai.llm.request.inference.config", request["inferenceConfig"]
+        )
+        trace.add_attribute("ai.llm.request.messages", request["messages"])
+        trace.add_attribute("ai.llm.request.model.id", model_id)
+        trace.add_attribute("ai.llm.request.system", request.get("system"))
+        trace.add_attribute("ai.llm.request.tool.config", request.get("toolConfig"))
+        if "guardrailConfig" in request:
+            trace.add_attribute(
+                "ai.llm.request.guardrail.config",
+                request["guardrailConfig"],
+            )
+
+        if "additionalModelRequestFields" in request:
+            trace.add_attribute(
+                "ai.llm.request.additional.model.request.fields",
+                request["additionalModelRequestFields"],
+            )
+
+        if "additionalModelResponseFieldPaths" in request:
+            trace.add_attribute(
+                "ai.llm.request.additional.model.response.field.paths",
+                request["additionalModelResponseFieldPaths"],
+            )
+
+        if "promptVariables" in request:
+            trace.add_attribute(
+                "ai.llm.request.prompt.variables",
+                request["promptVariables"],
+            )
+
+        if "requestMetadata" in request:
+            trace.add_attribute(
+                "ai.llm.request.request.metadata",
+                request["requestMetadata"],
+            )
+
+        if "performanceConfig" in request:
+            trace.add_attribute(
+                "ai.llm.request.performance.config",
+                request["performanceConfig"],
+            )
+
     def _invoke_tools(
         self,
         messages: Sequence["ContentBlockOutputTypeDef"],
@@ -863,42 +968,7 @@ class BedrockConverseAgent(Agent):
             "inferenceConfig": self.default_inference_config,
             "messages": list(self.messages),
         }
-        if self.default_guardrail_config:
-            request["guardrailConfig"] = self.default_guardrail_config
-        if self.system_prompt:
-            request["system"] = [
-                {
-                    "text": self.system_prompt,
-                },
-            ]
-        if self.default_model_request_fields:
-            request["additionalModelRequestFields"] = self.default_model_request_fields
-        if self.default_model_response_field_paths:
-            request["additionalModelResponseFieldPaths"] = (
-                self.default_model_response_field_paths
-            )
-        if self.default_prompt_variables:
-            request["promptVariables"] = self.default_prompt_variables
-        if self.default_request_metadata:
-            request["requestMetadata"] = self.default_request_metadata
-        if self.default_performance_config:
-            request["performanceConfig"] = self.default_performance_config
-        tools_available = self.tools
-        if tools is not None:
-            tools = [
-                BedrockConverseTool(tool) if callable(tool) else tool for tool in tools
-            ]
-            tools_available = (
-                {tool.tool_spec["name"]: tool for tool in tools}
-                if tools is not None
-                else {}
-            )
-        if tools_available:
-            request["toolConfig"] = {
-                "tools": [
-                    {"toolSpec": tool.tool_spec} for tool in tools_available.values()
-                ],
-            }
+        tools_available = self._add_request_defaults(request, tools)
 
         texts: list[str] = []
         for i in range(self.max_converse_iterations):
@@ -907,56 +977,7 @@ class BedrockConverseAgent(Agent):
                 cycle_trace.add_attribute("ai.agent.cycle.nr", i, inheritable=True)
 
                 with self._tracer.trace("llm-invocation", span_kind="CLIENT") as trace:
-                    model_id = request["modelId"]
-                    trace.add_attribute(
-                        "peer.service",
-                        self._shorten_bedrock_model_id(model_id, prefix="llm"),
-                    )
-                    trace.add_attribute("ai.trace.type", "llm-invocation")
-                    trace.add_attribute(
-                        "ai.llm.request.inference.config", request["inferenceConfig"]
-                    )
-                    trace.add_attribute("ai.llm.request.messages", request["messages"])
-                    trace.add_attribute("ai.llm.request.model.id", model_id)
-                    trace.add_attribute("ai.llm.request.system", request.get("system"))
-                    trace.add_attribute(
-                        "ai.llm.request.tool.config", request.get("toolConfig")
-                    )
-                    if "guardrailConfig" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.guardrail.config",
-                            request["guardrailConfig"],
-                        )
-
-                    if "additionalModelRequestFields" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.additional.model.request.fields",
-                            request["additionalModelRequestFields"],
-                        )
-
-                    if "additionalModelResponseFieldPaths" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.additional.model.response.field.paths",
-                            request["additionalModelResponseFieldPaths"],
-                        )
-
-                    if "promptVariables" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.prompt.variables",
-                            request["promptVariables"],
-                        )
-
-                    if "requestMetadata" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.request.metadata",
-                            request["requestMetadata"],
-                        )
-
-                    if "performanceConfig" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.performance.config",
-                            request["performanceConfig"],
-                        )
+                    self._add_llm_request_trace_attributes(trace, request)
                     trace.emit_snapshot()
 
                     try:
@@ -1236,42 +1257,7 @@ class BedrockConverseAgent(Agent):
             "inferenceConfig": self.default_inference_config,
             "messages": self.messages,
         }
-        if self.default_guardrail_config:
-            request["guardrailConfig"] = self.default_guardrail_config
-        if self.system_prompt:
-            request["system"] = [
-                {
-                    "text": self.system_prompt,
-                },
-            ]
-        if self.default_model_request_fields:
-            request["additionalModelRequestFields"] = self.default_model_request_fields
-        if self.default_model_response_field_paths:
-            request["additionalModelResponseFieldPaths"] = (
-                self.default_model_response_field_paths
-            )
-        if self.default_prompt_variables:
-            request["promptVariables"] = self.default_prompt_variables
-        if self.default_request_metadata:
-            request["requestMetadata"] = self.default_request_metadata
-        if self.default_performance_config:
-            request["performanceConfig"] = self.default_performance_config
-        tools_available = self.tools
-        if tools is not None:
-            tools = [
-                BedrockConverseTool(tool) if callable(tool) else tool for tool in tools
-            ]
-            tools_available = (
-                {tool.tool_spec["name"]: tool for tool in tools}
-                if tools is not None
-                else {}
-            )
-        if tools_available:
-            request["toolConfig"] = {
-                "tools": [
-                    {"toolSpec": tool.tool_spec} for tool in tools_available.values()
-                ],
-            }
+        tools_available = self._add_request_defaults(request, tools)
 
         texts: list[str] = []
         for i in range(self.max_converse_iterations):
@@ -1282,56 +1268,7 @@ class BedrockConverseAgent(Agent):
                 texts.append("")
 
                 with self._tracer.trace("llm-invocation", span_kind="CLIENT") as trace:
-                    model_id = request["modelId"]
-                    trace.add_attribute(
-                        "peer.service",
-                        self._shorten_bedrock_model_id(model_id, prefix="llm"),
-                    )
-                    trace.add_attribute("ai.trace.type", "llm-invocation")
-                    trace.add_attribute(
-                        "ai.llm.request.inference.config", request["inferenceConfig"]
-                    )
-                    trace.add_attribute("ai.llm.request.messages", request["messages"])
-                    trace.add_attribute("ai.llm.request.model.id", model_id)
-                    trace.add_attribute("ai.llm.request.system", request.get("system"))
-                    trace.add_attribute(
-                        "ai.llm.request.tool.config", request.get("toolConfig")
-                    )
-                    if "guardrailConfig" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.guardrail.config",
-                            request["guardrailConfig"],
-                        )
-
-                    if "additionalModelRequestFields" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.additional.model.request.fields",
-                            request["additionalModelRequestFields"],
-                        )
-
-                    if "additionalModelResponseFieldPaths" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.additional.model.response.field.paths",
-                            request["additionalModelResponseFieldPaths"],
-                        )
-
-                    if "promptVariables" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.prompt.variables",
-                            request["promptVariables"],
-                        )
-
-                    if "requestMetadata" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.request.metadata",
-                            request["requestMetadata"],
-                        )
-
-                    if "performanceConfig" in request:
-                        trace.add_attribute(
-                            "ai.llm.request.performance.config",
-                            request["performanceConfig"],
-                        )
+                    self._add_llm_request_trace_attributes(trace, request)
                     trace.emit_snapshot()
 
                     try:
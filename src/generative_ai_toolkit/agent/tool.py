@@ -51,6 +51,39 @@ class Tool(Protocol):
 
 class BedrockConverseTool(Tool):
 
+    # Look for NumPy-style Parameters section: "Parameters" followed by dashes/equals (e.g., "---" or "===")
+    PARAMETER_SECTION_REGEXP = re.compile(r"Parameters\s*[-=]{3,}\s*")
+
+    # Pattern matches NumPy-style section headers like "Examples\n---" or "Returns\n==="
+    # \n           - newline before section name
+    # ([A-Z][\w\s]+) - section name starting with capital letter, followed by word chars/spaces
+    # \n           - newline after section name
+    # [-=]{3,}     - at least 3 dashes or equals for underline
+    # \s*          - optional trailing whitespace
+    SECTION_REGEXP = re.compile(r"\n([A-Z][\w\s]+)\n[-=]{3,}\s*")
+
+    # Complex regex to match NumPy-style parameter entries with multi-line descriptions
+    # Example it matches:
+    #     param_name : str
+    #         This is the description line 1.
+    #         Description line 2.
+    #
+    #         Description line 3 after blank line.
+    PARAMETER_REGEXP = re.compile(
+        r"^"  # Match at start of line (with re.MULTILINE, this is any line start)
+        r"(?P<indent>[ \t]*)"  # Capture the indentation (spaces/tabs) of the parameter line
+        r"(?P<name>\w+)"  # Capture the parameter name (letters, digits, underscore)
+        r"\s*:\s*"  # Match colon with optional whitespace around it
+        r".*"  # Match the rest of the line (type annotation, etc.)
+        r"\r?\n"  # Match newline (handles both Unix \n and Windows \r\n)
+        r"(?P<desc>("  # Start capturing the description block as a group
+        r"^(?P=indent)[ \t]+[^\r\n]*(?:\r?\n|\Z)"  # Description line: same indent + extra spaces/tab + content + newline/end
+        r"|"  # OR
+        r"^[ \t]*(?:\r?\n|\Z)"  # A blank line (only whitespace) + newline/end
+        r")+)",  # One or more description/blank lines (the + makes it required)
+        re.MULTILINE,  # ^ and $ match line boundaries, not just string boundaries
+    )
+
     def __init__(
         self, func: Callable, *, tool_spec: "ToolSpecificationTypeDef | None" = None
     ):
@@ -91,21 +124,12 @@ class BedrockConverseTool(Tool):
             )
 
         docstring = textwrap.dedent(func.__doc__).strip()
-        # Look for NumPy-style Parameters section: "Parameters" followed by dashes/equals (e.g., "---" or "===")
-        parameter_section_match = re.search(r"Parameters\s*[-=]{3,}\s*", docstring)
+        parameter_section_match = self.PARAMETER_SECTION_REGEXP.search(docstring)
         if parameter_section_match:
             # Find where the Parameters section ends (when the next section starts)
-            # Pattern matches NumPy-style section headers like "Examples\n---" or "Returns\n==="
-            # \n           - newline before section name
-            # ([A-Z][\w\s]+) - section name starting with capital letter, followed by word chars/spaces
-            # \n           - newline after section name
-            # [-=]{3,}     - at least 3 dashes or equals for underline
-            # \s*          - optional trailing whitespace
-            sections_pattern = r"\n([A-Z][\w\s]+)\n[-=]{3,}\s*"
-
             # Search for sections after the Parameters section
-            next_section_match = re.search(
-                sections_pattern, docstring[parameter_section_match.start() :]
+            next_section_match = self.SECTION_REGEXP.search(
+                docstring[parameter_section_match.start() :]
             )
 
             if next_section_match:
@@ -189,32 +213,10 @@ class BedrockConverseTool(Tool):
         - Stops before the next param with the same indent or section end.
         - Handles final lines without a trailing newline.
         """
-        # Complex regex to match NumPy-style parameter entries with multi-line descriptions
-        # Example it matches:
-        #     param_name : str
-        #         This is the description line 1.
-        #         Description line 2.
-        #
-        #         Description line 3 after blank line.
-        param_pattern = re.compile(
-            r"^"  # Match at start of line (with re.MULTILINE, this is any line start)
-            r"(?P<indent>[ \t]*)"  # Capture the indentation (spaces/tabs) of the parameter line
-            r"(?P<name>\w+)"  # Capture the parameter name (letters, digits, underscore)
-            r"\s*:\s*"  # Match colon with optional whitespace around it
-            r".*"  # Match the rest of the line (type annotation, etc.)
-            r"\r?\n"  # Match newline (handles both Unix \n and Windows \r\n)
-            r"(?P<desc>("  # Start capturing the description block as a group
-            r"^(?P=indent)[ \t]+[^\r\n]*(?:\r?\n|\Z)"  # Description line: same indent + extra spaces/tab + content + newline/end
-            r"|"  # OR
-            r"^[ \t]*(?:\r?\n|\Z)"  # A blank line (only whitespace) + newline/end
-            r")+)",  # One or more description/blank lines (the + makes it required)
-            re.MULTILINE,  # ^ and $ match line boundaries, not just string boundaries
-        )
-
         src = self.parameter_description or ""
         results: dict[str, str] = {}
 
-        for m in param_pattern.finditer(src):
+        for m in self.PARAMETER_REGEXP.finditer(src):
             name = m.group("name")
             desc_block = m.group("desc")
 
@@ -38,6 +38,8 @@ CONFIG_PATHS = [
     os.path.expanduser("~/.aws/amazonq/mcp.json"),
 ]
 
+MCP_TOOL_CALL_TIMEOUT = timedelta(seconds=30)
+
 DIM = "\033[2m"
 RESET = "\033[0m"
 
@@ -75,6 +77,51 @@ class VerifyMcpServerToolType(Protocol):
     ) -> Any | Awaitable[Any]: ...
 
 
+class McpTool:
+    """
+    A tool that is served by an MCP server.
+
+    Invocations are dispatched to the event loop that owns the MCP client session,
+    and block until the MCP server has responded.
+    """
+
+    __slots__ = ("agent", "loop", "session", "_tool_spec")
+
+    def __init__(
+        self,
+        *,
+        agent: Agent,
+        loop: asyncio.AbstractEventLoop,
+        session: ClientSession,
+        tool_spec: "ToolSpecificationTypeDef",
+    ):
+        self.agent = agent
+        self.loop = loop
+        self.session = session
+        self._tool_spec = tool_spec
+
+    @property
+    def tool_spec(self) -> "ToolSpecificationTypeDef":
+        return self._tool_spec
+
+    def __repr__(self) -> str:
+        return f"McpTool(name='{self._tool_spec["name"]}')"
+
+    def invoke(self, **kwargs):
+        fut = asyncio.run_coroutine_threadsafe(
+            self.session.call_tool(
+                self._tool_spec["name"],
+                arguments=kwargs,
+                read_timeout_seconds=MCP_TOOL_CALL_TIMEOUT,
+            ),
+            self.loop,
+        )
+
+        res = fut.result().model_dump()
+        self.agent.tracer.current_trace.add_attribute("ai.mcp.response", res)
+        return res["content"][0]["text"]
+
+
 class McpClient:
 
     def __init__(
@@ -172,23 +219,13 @@ class McpClient:
                     tool_spec=tool_spec,
                 )
 
-        def func(**kwargs):
-            fut = asyncio.run_coroutine_threadsafe(
-                session.call_tool(
-                    tool.name,
-                    arguments=kwargs,
-                    read_timeout_seconds=timedelta(seconds=30),
-                ),
-                loop,
-            )
-
-            res = fut.result().model_dump()
-            self.agent.tracer.current_trace.add_attribute("ai.mcp.response", res)
-            return res["content"][0]["text"]
-
         self.agent.register_tool(
-            func,
-            tool_spec=tool_spec,
+            McpTool(
+                agent=self.agent,
+                loop=loop,
+                session=session,
+                tool_spec=tool_spec,
+            )
         )
 
     async def connect_to_mcp_server(self, mcp_server_config: McpServerConfig):
@@ -14,9 +14,21 @@
 
 from collections.abc import Sequence
 
+from botocore.config import Config
+
 from generative_ai_toolkit.metrics.measurement import Measurement
 from generative_ai_toolkit.tracer.tracer import Trace
 
+_METRIC_CLIENT_CONFIG = Config(
+    # Used by the built-in metrics for their AWS clients.
+    # GenerativeAIToolkit.eval() runs metrics on a ThreadPoolExecutor, which by default has min(32, cpu_count + 4) workers,
+    # so a pool of 32 connections lets all of them share the metric's client without connections being discarded.
+    # If you run evaluations with a larger max_metric_workers, reassign the built-in metric's client
+    # (metric.bedrock_client, or metric.comprehend_client for SentimentMetric) with one that has a matching pool size.
+    max_pool_connections=32,
+    tcp_keepalive=True,
+)
+
 
 class BaseMetric:
     """
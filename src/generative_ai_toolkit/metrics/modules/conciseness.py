@@ -18,6 +18,7 @@ import textwrap
 import boto3
 
 from generative_ai_toolkit.metrics import BaseMetric, Measurement
+from generative_ai_toolkit.metrics.base_metric import _METRIC_CLIENT_CONFIG
 from generative_ai_toolkit.test import user_conversation_from_trace
 from generative_ai_toolkit.utils.llm_response import json_parse
 
@@ -30,7 +31,10 @@ class AgentResponseConcisenessMetric(BaseMetric):
     def __init__(self, model_id="anthropic.claude-3-sonnet-20240229-v1:0"):
         super().__init__()
         self.model_id = model_id
-        self.bedrock_client = boto3.client("bedrock-runtime")
+        self.bedrock_client = boto3.client(
+            "bedrock-runtime",
+            config=_METRIC_CLIENT_CONFIG,
+        )
 
     def evaluate_conversation(self, conversation_traces, **kwargs):
         for trace in reversed(conversation_traces):
@@ -18,6 +18,7 @@ import textwrap
 import boto3
 
 from generative_ai_toolkit.metrics import BaseMetric, Measurement
+from generative_ai_toolkit.metrics.base_metric import _METRIC_CLIENT_CONFIG
 from generative_ai_toolkit.test import CaseTrace, user_conversation_from_trace
 from generative_ai_toolkit.utils.llm_response import json_parse
 
@@ -35,7 +36,10 @@ class ConversationExpectationMetric(BaseMetric):
     ):
         super().__init__()
         self.model_id = model_id
-        self.bedrock_client = boto3.client("bedrock-runtime")
+        self.bedrock_client = boto3.client(
+            "bedrock-runtime",
+            config=_METRIC_CLIENT_CONFIG,
+        )
         self.expectations = expectations
 
     def evaluate_conversation(self, conversation_traces, **kwargs):
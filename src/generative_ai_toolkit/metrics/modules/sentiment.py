@@ -15,6 +15,7 @@
 import boto3
 
 from generative_ai_toolkit.metrics import BaseMetric, Measurement
+from generative_ai_toolkit.metrics.base_metric import _METRIC_CLIENT_CONFIG
 from generative_ai_toolkit.test import user_conversation_from_trace
 
 
@@ -33,7 +34,10 @@ class SentimentMetric(BaseMetric):
         This constructor initializes the SentimentMetric instance by calling the parent class constructor.
         """
         super().__init__()
-        self.comprehend_client = boto3.client("comprehend")
+        self.comprehend_client = boto3.client(
+            "comprehend",
+            config=_METRIC_CLIENT_CONFIG,
+        )
 
     def evaluate_conversation(self, conversation_traces, **kwargs):
         """
@@ -21,6 +21,7 @@ import numpy as np
 from sklearn.metrics.pairwise import cosine_similarity
 
 from generative_ai_toolkit.metrics import BaseMetric, Measurement
+from generative_ai_toolkit.metrics.base_metric import _METRIC_CLIENT_CONFIG
 from generative_ai_toolkit.test import Case, CaseTrace, user_conversation_from_trace
 
 
@@ -39,7 +40,10 @@ class AgentResponseSimilarityMetric(BaseMetric):
         embeddings_model_id="amazon.titan-embed-text-v2:0",
     ):
         super().__init__()
-        self.bedrock_client = (session or boto3).client("bedrock-runtime")
+        self.bedrock_client = (session or boto3).client(
+            "bedrock-runtime",
+            config=_METRIC_CLIENT_CONFIG,
+        )
         self.embeddings_model_id = embeddings_model_id
         self.expected_embeddings = {}
         self.lock = Lock()
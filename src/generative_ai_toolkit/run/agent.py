@@ -120,13 +120,13 @@ class _Runner:
                 auth_context = self.auth_context_fn(request)
                 agent.set_auth_context(**auth_context)
             except Exception as err:
-                logger.warn(f"Forbidden: {err}")
+                logger.warn("Forbidden", error=str(err))
                 return Response("Forbidden", status=403)
 
             try:
                 body = Body.model_validate_json(request.data)
             except Exception as err:
-                logger.info(f"Unprocessable entity: {err}")
+                logger.info("Unprocessable entity", error=str(err))
                 return Response("Unprocessable entity", status=422)
 
             x_conversation_id = request.headers.get("x-conversation-id")
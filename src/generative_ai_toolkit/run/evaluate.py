@@ -84,12 +84,23 @@ deserializer = TypeDeserializer()
 
 ssm = boto3.client("ssm")
 
+SAMPLING_RATE_TTL_SECONDS = 60
+
+_sampling_rate: tuple[float, int] | None = None  # (expires at, sampling rate)
+
 
 def get_sampling_rate():
     """
     Get the sampling rate from SSM Parameter Store.
+
+    The value is cached for SAMPLING_RATE_TTL_SECONDS, so warm invocations don't each need a round trip to SSM.
+    Changes to the parameter take effect within that time.
     """
-    return max(
+    global _sampling_rate  # noqa: PLW0603
+    now = time.monotonic()
+    if _sampling_rate and now < _sampling_rate[0]:
+        return _sampling_rate[1]
+    sampling_rate = max(
         0,
         min(
             100,
@@ -102,6 +113,8 @@ def get_sampling_rate():
             ),
         ),
     )
+    _sampling_rate = (now + SAMPLING_RATE_TTL_SECONDS, sampling_rate)
+    return sampling_rate
 
 
 def measure(
@@ -117,11 +130,9 @@ def measure(
     logger.debug(
         "Evaluating traces",
         sampled_nr_of_conversations=len(conversations_to_evaluate),
-        sampled_nr_of_traces=len(
-            [_ for conversation in conversations_to_evaluate for _ in conversation]
-        ),
+        sampled_nr_of_traces=sum(map(len, conversations_to_evaluate)),
         nr_of_conversations=len(conversations),
-        nr_of_traces=len([_ for conversation in conversations for _ in conversation]),
+        nr_of_traces=sum(map(len, conversations)),
     )
 
     logger.debug(
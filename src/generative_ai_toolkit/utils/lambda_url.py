@@ -82,12 +82,14 @@ class IamAuthInvoker:
         # nosemgrep: python.lang.security.audit.dynamic-urllib-use-detected
         return urllib.request.urlopen(request, timeout=30)
 
-    def _response_body_iterator(self, response: http.client.HTTPResponse, chunk_size=4):
+    def _response_body_iterator(
+        self, response: http.client.HTTPResponse, chunk_size=64 * 1024
+    ):
         """
-        Iterate over the response body, one chunk of size chunk_size at a time
+        Iterate over the response body, yielding whatever has arrived so far (up to chunk_size bytes) at a time
         """
         with response:
-            while bytes_ := response.read(chunk_size):
+            while bytes_ := response.read1(chunk_size):
                 yield bytes_
 
     def converse_stream(
@@ -0,0 +1,60 @@
+# Copyright 2025 Amazon.com, Inc. and its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from generative_ai_toolkit.run import evaluate
+
+
+@pytest.fixture
+def ssm(monkeypatch):
+    ssm = MagicMock()
+    monkeypatch.setattr(evaluate, "ssm", ssm)
+    monkeypatch.setattr(evaluate, "_sampling_rate", None)
+    monkeypatch.setenv("SAMPLING_RATE_PARAM_NAME", "/test/sampling-rate")
+    return ssm
+
+
+def set_sampling_rate(ssm: MagicMock, value: str):
+    ssm.get_parameter.return_value = {"Parameter": {"Value": value}}
+
+
+def test_get_sampling_rate_is_cached(ssm, monkeypatch):
+    monotonic = MagicMock(return_value=1000.0)
+    monkeypatch.setattr(evaluate.time, "monotonic", monotonic)
+    set_sampling_rate(ssm, "25")
+
+    assert evaluate.get_sampling_rate() == 25
+    ssm.get_parameter.assert_called_once_with(Name="/test/sampling-rate")
+
+    set_sampling_rate(ssm, "75")
+    monotonic.return_value = 1000.0 + evaluate.SAMPLING_RATE_TTL_SECONDS - 1
+    assert evaluate.get_sampling_rate() == 25
+    assert ssm.get_parameter.call_count == 1
+
+    monotonic.return_value = 1000.0 + evaluate.SAMPLING_RATE_TTL_SECONDS
+    assert evaluate.get_sampling_rate() == 75
+    assert ssm.get_parameter.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [("150", 100), ("-5", 0), ("0", 0), ("100", 100), ("42", 42)],
+)
+def test_get_sampling_rate_is_clamped(ssm, value, expected):
+    set_sampling_rate(ssm, value)
+    assert evaluate.get_sampling_rate() == expected
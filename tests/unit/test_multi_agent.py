@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import weakref
 from collections import defaultdict
 from collections.abc import Sequence
+from unittest.mock import MagicMock
+
+import pytest
 
 from generative_ai_toolkit.agent import BedrockConverseAgent
+from generative_ai_toolkit.conversation_history import InMemoryConversationHistory
 from generative_ai_toolkit.test import Expect
 from generative_ai_toolkit.test.mock import MockBedrockConverse
 from generative_ai_toolkit.tracer import Trace
@@ -277,3 +283,65 @@ def test_multi_agent_with_reused_subagent():
 
     assert not l1_span_ids & l2_span_ids
     assert not l3_from_l1_span_ids & l3_from_l2_span_ids
+
+
+def test_spawn_shares_bedrock_client():
+    session = MagicMock()
+    session.client.side_effect = lambda *args, **kwargs: MagicMock()
+    agent = BedrockConverseAgent(
+        model_id="dummy",
+        session=session,
+        name="spawnable_agent",
+        description="Agent that is spawned",
+    )
+    spawned = agent.spawn()
+
+    assert spawned is not agent
+    assert spawned.bedrock_client is agent.bedrock_client
+    assert spawned.tracer is agent.tracer
+    assert spawned.conversation_id != agent.conversation_id
+
+
+def test_conversation_history_instances_are_tracked_weakly():
+    session = MagicMock()
+    session.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+    class SubAgent(BedrockConverseAgent):
+        pass
+
+    gc.collect()
+    instances_before = set(BedrockConverseAgent._instances_used)
+
+    history = InMemoryConversationHistory()
+    agent = BedrockConverseAgent(
+        model_id="dummy", session=session, conversation_history=history
+    )
+    assert weakref.ref(history) in BedrockConverseAgent._instances_used
+
+    with pytest.raises(RuntimeError):
+        BedrockConverseAgent(
+            model_id="dummy", session=session, conversation_history=history
+        )
+    with pytest.raises(RuntimeError):
+        SubAgent(model_id="dummy", session=session, conversation_history=history)
+
+    history_ref = weakref.ref(history)
+    del agent, history
+    gc.collect()
+    assert history_ref() is None
+    assert BedrockConverseAgent._instances_used == instances_before
+
+    agent = BedrockConverseAgent(
+        model_id="dummy",
+        session=session,
+        conversation_history=InMemoryConversationHistory,
+        name="spawnable_agent",
+        description="Agent that is spawned",
+    )
+    spawned = agent.spawn()
+    assert spawned.conversation_history is not agent.conversation_history
+    assert len(BedrockConverseAgent._instances_used - instances_before) == 2
+
+    del agent, spawned
+    gc.collect()
+    assert BedrockConverseAgent._instances_used == instances_before